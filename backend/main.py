@@ -28,6 +28,20 @@ import re
 from scraper.dynamic_scraper import run_dynamic_scraper
 import api.extension_projects
 from api.comparison import router as comparison_router
+import logging
+import logging.handlers
+import queue
+
+# Route logging through a queue so the stream I/O happens on one dedicated
+# listener thread - extraction workers then never block (or hold the GIL)
+# on a synchronous write when transient errors spike
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
 
 app = FastAPI(default_response_class=MongoJSONResponse)
 
@@ -735,12 +749,18 @@ async def get_project_visited_links(project_id: str, user: dict = Depends(get_cu
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        # Get visited links from processing status
-        visited_links = project.get("processing_status", {}).get("visited_links", {})
-        
+        # Visit records live in their own collection keyed by project_id;
+        # older projects still carry them embedded in processing_status, so
+        # fall back to that when the collection has nothing
+        visited_links = {}
+        async for doc in db.visited_links.find({"project_id": ObjectId(project_id)}, {"_id": 0, "project_id": 0}):
+            visited_links[doc.get("url", "")] = doc
+        if not visited_links:
+            visited_links = project.get("processing_status", {}).get("visited_links", {})
+
         # Get network stats from processing status
         network_stats = project.get("processing_status", {}).get("network_stats", {})
-        
+
         # Convert dict to list and add helpful metadata
         links_list = []
         for url, link_data in visited_links.items():
@@ -1,51 +1,303 @@
 from scraper.robots import Robots
 from scraper.sitemap import Sitemap
-from scraper.site import scrape_website, store_in_mongodb
+from scraper.site import scrape_website, store_many_in_mongodb
 from motor.motor_asyncio import AsyncIOMotorClient
 from fastapi import HTTPException
+import atexit
 import datetime
+import os
+import sys
+import socket
 from bson import ObjectId
-import traceback
+import logging
 import threading
 import asyncio
 import concurrent.futures
 import queue
 from queue import Queue
+from collections import deque, namedtuple
+import functools
 import json
 import uuid
 import time
 import math
+import heapq
 from utils.websocket_manager import ConnectionManager
 import re
 import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urlparse
-from pymongo import MongoClient
+from urllib.parse import urlparse, urljoin, urlsplit, urlunsplit
+from pymongo import MongoClient, UpdateOne, WriteConcern
 from typing import Optional, List
 
+try:
+    import ahocorasick  # C-extension multi-pattern matcher (pyahocorasick)
+except ImportError:
+    ahocorasick = None
+
+try:
+    from pybloom_live import ScalableBloomFilter  # approximate set, ~bytes/URL
+except ImportError:
+    ScalableBloomFilter = None
+
+try:
+    import lxml  # C parser backend for BeautifulSoup, much faster per page
+    BS_PARSER = "lxml"
+except ImportError:
+    BS_PARSER = "html.parser"
+
+# Pooled keep-alive session for fetches that happen outside a crawl's own
+# per-extraction session (the keyword-check fallback and the legacy link
+# walker). Reusing connections skips the TCP/TLS handshake per request.
+_shared_session = requests.Session()
+_shared_adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=32)
+_shared_session.mount("http://", _shared_adapter)
+_shared_session.mount("https://", _shared_adapter)
+
+# Browser-style headers for keyword-check fetches, built once instead of a
+# fresh dict per call
+_UA_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
+}
+
+# Exception reporting goes through logging so tracebacks are only formatted
+# when a handler will actually emit them
+logger = logging.getLogger(__name__)
+
 client = AsyncIOMotorClient("mongodb://localhost:27017")
 db = client.hackathon
 projects_collection = db.projects
 users_collection = db.users
 
-# Global thread pool for extraction tasks
-thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=5)
-# Message queue for extraction logs
+# Shared synchronous client for worker threads. One pooled client for the whole
+# process is much cheaper than constructing a client (and its event-loop and
+# connection-pool setup) inside every extraction thread.
+sync_client = MongoClient("mongodb://localhost:27017", maxPoolSize=50)
+sync_db = sync_client.hackathon
+sync_projects_collection = sync_db.projects
+# Per-link visit records live in their own collection keyed by
+# (project_id, url) - embedding them in the project document meant
+# re-sending the whole growing dict on every save and risked the 16MB
+# document limit on large walks
+sync_visited_links_collection = sync_db.visited_links
+# The client lives for the whole process; close its pool on interpreter exit
+atexit.register(sync_client.close)
+
+# Shared buffer of project updates from all extraction threads. Enqueued ops
+# ship together in one unordered bulk_write, so concurrent crawls flushing
+# progress at the same time cost one round-trip instead of one each. Final
+# status writes still use the direct helpers - completion must be durable
+# the moment it is reported.
+PENDING_OPS_FLUSH_COUNT = 50
+PENDING_OPS_FLUSH_INTERVAL = 0.1  # seconds
+# Buffered as (project_oid, update_dict) tuples so consecutive updates to the
+# same project can be merged in place; UpdateOne objects are materialized at
+# flush time
+_pending_ops = deque()
+_pending_ops_lock = threading.Lock()
+_pending_ops_state = {"last_flush": time.monotonic()}
+# Unacknowledged handle for periodic progress flushes - these carry
+# incremental counters and page lists where losing one batch only means
+# slightly stale progress, so skipping the server ack wait is safe
+_projects_w0 = sync_projects_collection.with_options(write_concern=WriteConcern(w=0))
+
+def flush_pending_ops(durable=False):
+    """Ship every buffered project update in one unordered bulk_write.
+
+    durable=True waits for the server acknowledgement; the terminal-status
+    paths use it so nothing is in flight when completion is reported.
+    """
+    with _pending_ops_lock:
+        if not _pending_ops:
+            _pending_ops_state["last_flush"] = time.monotonic()
+            return
+        ops = [UpdateOne({"_id": oid}, update) for oid, update in _pending_ops]
+        _pending_ops.clear()
+        _pending_ops_state["last_flush"] = time.monotonic()
+    try:
+        coll = sync_projects_collection if durable else _projects_w0
+        coll.bulk_write(ops, ordered=False)
+    except Exception:
+        logger.exception("Error flushing buffered project updates")
+
+def _merge_updates(tail, new):
+    """Fold new's $set/$push into the tail update in place.
+
+    Returns False (leaving both untouched) when either side uses an operator
+    other than $set/$push, so such ops stay separate rather than risking a
+    bad merge.
+    """
+    if any(k not in ("$set", "$push") for k in new) or any(k not in ("$set", "$push") for k in tail):
+        return False
+    if "$set" in new:
+        tail.setdefault("$set", {}).update(new["$set"])
+    if "$push" in new:
+        tail_push = tail.setdefault("$push", {})
+        for field, spec in new["$push"].items():
+            items = spec["$each"] if isinstance(spec, dict) and "$each" in spec else [spec]
+            current = tail_push.get(field)
+            if current is None:
+                tail_push[field] = {"$each": list(items)}
+            else:
+                if not (isinstance(current, dict) and "$each" in current):
+                    current = tail_push[field] = {"$each": [current]}
+                current["$each"].extend(items)
+    return True
+
+def queue_project_update(project_oid, update):
+    """Buffer one update against a project document.
+
+    Consecutive updates for the same project merge into a single combined
+    $set/$push document, so the common "counters plus appended rows" pattern
+    costs one op instead of two. Flushes when the buffer fills or the flush
+    interval elapses; callers at durability points (completion, interruption,
+    thread exit) must call flush_pending_ops() themselves.
+    """
+    with _pending_ops_lock:
+        merged = False
+        if _pending_ops:
+            tail_oid, tail_update = _pending_ops[-1]
+            if tail_oid == project_oid:
+                merged = _merge_updates(tail_update, update)
+        if not merged:
+            _pending_ops.append((project_oid, update))
+        should_flush = (
+            len(_pending_ops) >= PENDING_OPS_FLUSH_COUNT
+            or time.monotonic() - _pending_ops_state["last_flush"] >= PENDING_OPS_FLUSH_INTERVAL
+        )
+    if should_flush:
+        flush_pending_ops()
+
+# Global thread pool for extraction tasks. The workload is I/O-bound
+# (crawling), so size it from the CPU count with headroom instead of a
+# fixed 5 workers that would serialize concurrent users. Overridable via
+# EXTRACTION_WORKERS for hosts where the default is a poor fit.
+MAX_EXTRACTION_WORKERS = int(
+    os.environ.get("EXTRACTION_WORKERS", min(32, (os.cpu_count() or 1) * 4))
+)
+# Cap on in-flight + queued extractions; beyond this we return HTTP 429
+# instead of queueing unbounded work (each job holds its status dicts in RAM)
+MAX_QUEUED_EXTRACTIONS = 50
+thread_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=MAX_EXTRACTION_WORKERS, thread_name_prefix="extraction"
+)
+extraction_slots = threading.BoundedSemaphore(MAX_QUEUED_EXTRACTIONS)
+# Concurrent page fetchers per extraction. Each crawl targets a single host,
+# so keep this modest rather than hammering one site with dozens of threads.
+# FETCH_WORKERS in the environment adjusts it per deployment.
+FETCH_WORKERS = int(os.environ.get("FETCH_WORKERS", 8))
+# Hard cap on the crawl frontier; focused crawls drop the lowest-scoring
+# entries instead of growing without bound on heavily-linked sites
+MAX_FRONTIER_SIZE = 10000
+# Robots/sitemap results cached per host so back-to-back projects against
+# the same site skip the refetch (and the Mongo re-insert) entirely
+HOST_CACHE_TTL = 3600  # seconds
+_host_cache = {}  # (hostname, kind) -> (monotonic timestamp, object)
+_host_cache_lock = threading.Lock()
+_host_fetch_locks = {}  # hostname -> Lock serializing the first fetch
+
+def _cached_site_asset(host, kind, factory):
+    """Return the cached Robots/Sitemap for host, building it via factory on
+    a miss. The build runs under a per-host lock so concurrent extractions
+    against the same site don't all fetch at once."""
+    now = time.monotonic()
+    with _host_cache_lock:
+        entry = _host_cache.get((host, kind))
+        if entry and now - entry[0] < HOST_CACHE_TTL:
+            return entry[1]
+        fetch_lock = _host_fetch_locks.setdefault(host, threading.Lock())
+    with fetch_lock:
+        # Re-check - another thread may have filled the cache while we waited
+        with _host_cache_lock:
+            entry = _host_cache.get((host, kind))
+            if entry and time.monotonic() - entry[0] < HOST_CACHE_TTL:
+                return entry[1]
+        obj = factory()
+        with _host_cache_lock:
+            _host_cache[(host, kind)] = (time.monotonic(), obj)
+        return obj
+
+# Extensions that cannot yield scrapeable HTML - nested sitemap indexes and
+# binary assets that sometimes appear in sitemap page lists
+NON_HTML_EXTENSIONS = (
+    ".xml", ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp",
+    ".css", ".js", ".ico", ".zip", ".gz"
+)
+# Message queue for extraction logs (asyncio.Queue owned by the main event
+# loop) and the loop each queue belongs to, so worker threads can hand
+# messages over with call_soon_threadsafe instead of paying a mutex per put
 message_queues = {}
+message_loops = {}
 # Dictionary to track active extraction processes with interrupt flags
 active_extractions = {}
+# Per-client asyncio.Event set once when the extraction reaches a terminal
+# state, so the log consumer exits on an edge-triggered signal instead of
+# re-reading the status dicts on every timeout tick
+extraction_done_events = {}
 # Dictionary to track detailed extraction statistics
 extraction_stats = {}
 
-MAX_MONGODB_DOC_SIZE = 12 * 1024 * 1024  # 12MB document size limit
-CHUNK_SIZE = 100  # Number of items per chunk
-
 # Status constants
 STATUS_RUNNING = "running"
 STATUS_INTERRUPTED = "interrupted"
 STATUS_COMPLETED = "completed"
 STATUS_ERROR = "error"
 
+# Fixed-shape envelope for plain log entries. A namedtuple is several times
+# smaller than the equivalent dict and carries no per-message hash table;
+# the dict the frontend sees is only materialized at send time.
+_LogEntry = namedtuple("_LogEntry", ("type", "message", "timestamp", "args"))
+
+def _finalize_log_entry(message):
+    """Format a queued log entry just before sending.
+
+    Applies any deferred %-style formatting from send_log and converts the
+    float timestamp to an ISO string, so neither cost is paid on the hot path.
+    log_batch frames have each of their inner messages finalized.
+    """
+    if isinstance(message, _LogEntry):
+        text = message.message
+        if message.args:
+            try:
+                text = text % message.args
+            except (TypeError, ValueError):
+                # Mismatched format string - send it raw rather than losing the log
+                text = f"{text} {message.args}"
+        return {
+            "type": message.type,
+            "message": text,
+            "timestamp": datetime.datetime.utcfromtimestamp(message.timestamp).isoformat()
+        }
+    if message.get("type") == "log_batch":
+        message["messages"] = [_finalize_log_entry(m) for m in message.get("messages", [])]
+    args = message.pop("args", None)
+    if args:
+        try:
+            message["message"] = message["message"] % args
+        except (TypeError, ValueError):
+            # Mismatched format string - send it raw rather than losing the log
+            message["message"] = f"{message['message']} {args}"
+    ts = message.get("timestamp")
+    if isinstance(ts, (int, float)):
+        message["timestamp"] = datetime.datetime.utcfromtimestamp(ts).isoformat()
+    return message
+
+# Upper bound on how many queued messages the consumer folds into one frame
+MAX_DRAIN_BATCH = 50
+# Message types that keep their own WebSocket frame so the frontend handlers
+# for them still fire; everything else can ride in a log_batch
+STANDALONE_MESSAGE_TYPES = ("completion", "status", "network")
+
+def _wrap_log_batch(entries):
+    """Wrap a list of log entries in a single log_batch frame"""
+    if len(entries) == 1:
+        return entries[0]
+    return {
+        "type": "log_batch",
+        "messages": entries,
+        "timestamp": time.time()
+    }
+
 async def consume_messages(client_id, ws_manager):
     """
     Asynchronous task to consume messages from the queue and send them via WebSocket.
@@ -57,161 +309,355 @@ async def consume_messages(client_id, ws_manager):
         return
     
     q = message_queues[client_id]
+    done_event = extraction_done_events.get(client_id)
     msg_buffer = []  # Buffer for messages that couldn't be sent due to disconnection
     
     try:
         print(f"Starting message consumer for client {client_id}")
         while True:
             try:
-                # Use a non-blocking get with timeout
+                # Sleep until a message arrives; the short timeout keeps the
+                # buffered-message retry and exit checks below running
                 try:
-                    message = q.get(block=False)
-                    
-                    # Try to send the message via WebSocket
-                    try:
-                        await ws_manager.send_personal_json(message, client_id)
-                        # Message was sent successfully
+                    message = await asyncio.wait_for(q.get(), timeout=0.5)
+                    q.task_done()
+
+                    # Drain whatever queued up behind it so a burst of logs
+                    # becomes one WebSocket frame (one JSON encode, one send)
+                    # instead of one frame per entry
+                    drained = [message]
+                    while not q.empty() and len(drained) < MAX_DRAIN_BATCH:
+                        drained.append(q.get_nowait())
                         q.task_done()
+
+                    # Group plain logs into log_batch frames, flattening any
+                    # producer-side batches; completion/status/network frames
+                    # go out on their own, in order
+                    outgoing = []
+                    batch = []
+                    for msg in drained:
+                        if isinstance(msg, _LogEntry):
+                            batch.append(msg)
+                        elif msg.get("type") == "log_batch":
+                            batch.extend(msg.get("messages", []))
+                        elif msg.get("type") in STANDALONE_MESSAGE_TYPES:
+                            if batch:
+                                outgoing.append(_wrap_log_batch(batch))
+                                batch = []
+                            outgoing.append(msg)
+                        else:
+                            batch.append(msg)
+                    if batch:
+                        outgoing.append(_wrap_log_batch(batch))
+
+                    # Try to send via WebSocket; buffer anything unsent
+                    sent = 0
+                    try:
+                        for out_msg in outgoing:
+                            await ws_manager.send_personal_json(_finalize_log_entry(out_msg), client_id)
+                            sent += 1
                     except Exception as ws_err:
-                        # WebSocket error - store message in buffer
+                        # WebSocket error - store unsent messages in buffer
                         print(f"WebSocket send error for client {client_id}: {str(ws_err)}")
-                        msg_buffer.append(message)
-                        q.task_done()
-                        
-                except queue.Empty:
+                        msg_buffer.extend(outgoing[sent:])
+
+                except asyncio.TimeoutError:
                     # No new messages, try to send any buffered messages if connection is available
                     if msg_buffer and client_id in ws_manager.active_connections:
                         try:
                             # Try to send the oldest buffered message
-                            await ws_manager.send_personal_json(msg_buffer[0], client_id)
+                            await ws_manager.send_personal_json(_finalize_log_entry(msg_buffer[0]), client_id)
                             # If successful, remove from buffer
                             msg_buffer.pop(0)
                             print(f"Sent buffered message to client {client_id}, {len(msg_buffer)} messages remaining")
                         except Exception as buffer_err:
                             # Still can't send, wait and try again later
                             print(f"Failed to send buffered message: {buffer_err}")
-                    
-                    # Wait a bit before checking again
-                    await asyncio.sleep(0.1)
-                    
-                    # Check if extraction is done and all messages have been processed
-                    if (client_id not in active_extractions or 
-                        active_extractions[client_id]["status"] in [STATUS_COMPLETED, STATUS_ERROR, STATUS_INTERRUPTED]):
+
+                    # Check if extraction is done and all messages have been
+                    # processed - the worker sets the done event exactly once
+                    # when it exits, whatever the terminal status was
+                    if done_event is None or done_event.is_set():
                         # If queue is empty and all buffered messages were sent, exit the loop
                         if q.empty() and not msg_buffer:
                             print(f"Consumer for {client_id} exiting - extraction complete and all messages delivered")
-                            if client_id in message_queues:
-                                del message_queues[client_id]
+                            message_queues.pop(client_id, None)
+                            message_loops.pop(client_id, None)
+                            extraction_done_events.pop(client_id, None)
                             break
                         # If messages remain but extraction is complete, try again with backoff
                         await asyncio.sleep(0.5)
                     continue
                     
             except Exception as e:
-                print(f"Error in message consumer for {client_id}: {str(e)}")
-                print(traceback.format_exc())
+                logger.exception("Error in message consumer for %s", client_id)
                 await asyncio.sleep(1)  # Prevent tight loop on error
     except Exception as e:
-        print(f"Fatal error in consumer for {client_id}: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Fatal error in consumer for %s", client_id)
     print(f"Message consumer for {client_id} has ended")
 
-def send_log(client_id, log_type, message):
-    """Add a log message to the client's message queue"""
-    if client_id not in message_queues:
-        print(f"No message queue found for client {client_id}")
+# Queue depth beyond which low-priority logs are dropped instead of buffered
+# forever (e.g. the WebSocket client disconnected mid-crawl)
+MAX_BUFFERED_LOGS = 1000
+DROPPABLE_LOG_TYPES = ("info", "detail")
+# Log levels the frontend understands; anything else is a programming error
+# and gets dropped here instead of confusing the client
+LOG_LEVELS = frozenset({"info", "detail", "success", "warning", "error", "completion"})
+
+def _queue_message(client_id, message):
+    """Hand a message to the client's queue from any thread.
+
+    The queue is an asyncio.Queue living on the main event loop, so worker
+    threads must route the put through call_soon_threadsafe rather than
+    touching the queue directly.
+    """
+    q = message_queues.get(client_id)
+    if q is None:
         return
-    
-    log_entry = {
-        "type": log_type,
-        "message": message,
-        "timestamp": datetime.datetime.utcnow().isoformat()
-    }
-    
+    loop = message_loops.get(client_id)
     try:
-        message_queues[client_id].put(log_entry)
-    except Exception as e:
-        print(f"Error adding log to queue for client {client_id}: {str(e)}")
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(q.put_nowait, message)
+        else:
+            q.put_nowait(message)
+    except RuntimeError as e:
+        # Loop shut down between the check and the call - drop the message
+        print(f"Error queueing message for client {client_id}: {str(e)}")
+
+def _signal_extraction_done(client_id):
+    """Tell the log consumer the extraction has finished (thread-safe).
+
+    The event lives on the main loop, so worker threads set it through
+    call_soon_threadsafe like any other cross-thread notification.
+    """
+    event = extraction_done_events.get(client_id)
+    if event is None:
+        return
+    loop = message_loops.get(client_id)
+    try:
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(event.set)
+        else:
+            event.set()
+    except RuntimeError:
+        event.set()
+
+def send_log(client_id, log_type, message, *args):
+    """
+    Add a log message to the client's message queue.
+
+    When args are given, message is treated as a %-style format string and
+    formatting is deferred to the consumer, so the hot path never pays for
+    building strings that may be dropped or never sent.
+    """
+    q = message_queues.get(client_id)
+    if q is None or log_type not in LOG_LEVELS:
+        return
+
+    # If the consumer has fallen far behind, drop progress noise rather than
+    # letting the queue grow without bound
+    if log_type in DROPPABLE_LOG_TYPES and q.qsize() > MAX_BUFFERED_LOGS:
+        return
+
+    # Float timestamp and tuple envelope - the ISO string and the dict the
+    # frontend expects are both built by the consumer just before sending
+    _queue_message(client_id, _LogEntry(log_type, message, time.time(), args or None))
+
+def detail_logging_enabled(client_id):
+    """
+    Cheap pre-check for hot paths: returns False when a detail/info log would
+    be dropped anyway (no queue, or the consumer is far behind), so callers
+    can skip computing the values that only feed that log.
+    """
+    q = message_queues.get(client_id)
+    if q is None:
+        return False
+    return q.qsize() <= MAX_BUFFERED_LOGS
+
+class LogBatcher:
+    """
+    Buffers low-priority log entries and flushes them to the client's message
+    queue as a single log_batch frame, so a crawl emitting several logs per
+    page pays one queue put (and one WebSocket frame) per batch instead of
+    per message. Errors and warnings bypass the buffer and go out immediately.
+
+    Not thread-safe - intended to be used from a single dispatcher thread;
+    worker threads should keep calling send_log directly.
+    """
+    FLUSH_COUNT = 50
+    FLUSH_INTERVAL = 0.25  # seconds
+    IMMEDIATE_TYPES = ("error", "warning", "completion")
+
+    def __init__(self, client_id):
+        self.client_id = client_id
+        self.entries = []
+        self.last_flush = time.monotonic()
+
+    def push(self, log_type, message, *args):
+        """Buffer a log entry, or send it straight away for urgent types"""
+        if log_type in self.IMMEDIATE_TYPES:
+            # Flush first so the urgent message arrives in order
+            self.flush()
+            send_log(self.client_id, log_type, message, *args)
+            return
+
+        self.entries.append(_LogEntry(log_type, message, time.time(), args or None))
+
+        if (len(self.entries) >= self.FLUSH_COUNT
+                or time.monotonic() - self.last_flush >= self.FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        """Push all buffered entries to the queue as one log_batch frame"""
+        if self.entries:
+            _queue_message(self.client_id, {
+                "type": "log_batch",
+                "messages": self.entries,
+                "timestamp": time.time()
+            })
+            self.entries = []
+        self.last_flush = time.monotonic()
+
+def build_keyword_automaton(keywords):
+    """
+    Build an Aho-Corasick automaton over the lowercased keywords so a page can
+    be scanned for all keywords in one pass. Returns None when pyahocorasick
+    is not installed; callers then fall back to per-keyword substring scans.
+    """
+    if not ahocorasick or not keywords:
+        return None
+    automaton = ahocorasick.Automaton()
+    for idx, keyword in enumerate(keywords):
+        automaton.add_word(keyword.lower(), (idx, keyword))
+    automaton.make_automaton()
+    return automaton
+
+def scan_text_for_keywords(text_lower, keywords, automaton=None):
+    """
+    Return a list of (keyword, end_index) hits found in text_lower.
+    Uses the automaton (single scan for all keywords) when available.
+    """
+    if automaton is not None:
+        return [(kw, end_idx) for end_idx, (_, kw) in automaton.iter(text_lower)]
+    hits = []
+    for keyword in keywords:
+        pos = text_lower.find(keyword.lower())
+        if pos != -1:
+            hits.append((keyword, pos + len(keyword)))
+    return hits
+
+def check_page_for_keywords(url, keywords, include_meta=True, automaton=None, html=None):
+    """Check if a page contains any of the specified keywords in all content including cards, text, and images.
 
-def check_page_for_keywords(url, keywords, include_meta=True):
-    """Check if a page contains any of the specified keywords in all content including cards, text, and images"""
+    Callers checking many pages with the same keywords should build the
+    automaton once with build_keyword_automaton and pass it in, instead of
+    paying the O(len(keywords)) construction on every page. When html is
+    given, that already-fetched markup is scanned directly and no request is
+    made - the crawl workers pass in the page they just scraped so each URL
+    is only fetched once.
+    """
     try:
         # Initialize results
         contains_keywords = False
         found_keywords = []
         meta_info = {}
         keyword_contexts = {}
-        
-        # Fetch the page content
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
+
+        # One automaton scans for all keywords in a single pass per text block
+        if automaton is None:
+            automaton = build_keyword_automaton(keywords)
+
+        # Lowercase every keyword once; the scans below otherwise redo it
+        # per keyword per element
+        kw_pairs = [(kw, kw.lower()) for kw in keywords]
+
+        # Fetch the page content unless the caller already has it
+        if html is None:
+            response = _shared_session.get(url, headers=_UA_HEADERS, timeout=15)
+            response.raise_for_status()
+            html = response.content
+
         # Parse the HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(html, BS_PARSER)
         
-        # Extract text content
+        # Extract the page text once; both scan strategies below work over
+        # this single lowercased string
         text_content = soup.get_text(separator=' ', strip=True).lower()
-        
-        # Check for keywords in main content
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower in text_content:
+
+        # Check for keywords in main content. With the automaton, one pass
+        # over the text finds every keyword along with its position, so the
+        # context window comes out of the same scan instead of a second find
+        if automaton is not None:
+            for end_idx, (_, keyword) in automaton.iter(text_content):
                 contains_keywords = True
-                if keyword not in found_keywords:  # Avoid duplicates
-                    found_keywords.append(keyword)
-                
-                # Get context for keyword (text around the keyword)
-                start_idx = text_content.find(keyword_lower)
+                if keyword in found_keywords:  # context from first hit only
+                    continue
+                found_keywords.append(keyword)
+                context_start = max(0, end_idx - len(keyword) - 49)
+                context = text_content[context_start:end_idx + 51]
+                keyword_contexts[keyword] = f"...{context.replace(chr(10), ' ').strip()}..."
+        else:
+            text_bytes = text_content.encode('utf-8')
+            text_view = memoryview(text_bytes)
+            for keyword, keyword_lower in kw_pairs:
+                keyword_bytes = keyword_lower.encode('utf-8')
+                start_idx = text_bytes.find(keyword_bytes)
                 if start_idx != -1:
+                    contains_keywords = True
+                    if keyword not in found_keywords:  # Avoid duplicates
+                        found_keywords.append(keyword)
+
+                    # Get context for keyword (text around the keyword), decoding
+                    # just the window instead of the whole page
                     context_start = max(0, start_idx - 50)
-                    context_end = min(len(text_content), start_idx + len(keyword) + 50)
-                    context = text_content[context_start:context_end].replace('\n', ' ').strip()
-                    keyword_contexts[keyword] = f"...{context}..."
+                    context_end = min(len(text_bytes), start_idx + len(keyword_bytes) + 50)
+                    context = bytes(text_view[context_start:context_end]).decode('utf-8', errors='ignore')
+                    keyword_contexts[keyword] = f"...{context.replace(chr(10), ' ').strip()}..."
         
         # Check specialized elements (cards, images, etc.) regardless of previous matches
         
         # Check image alt texts specifically
         for img in soup.find_all('img', alt=True):
             alt_text = img['alt'].lower()
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
+            for keyword, keyword_lower in kw_pairs:
                 if keyword_lower in alt_text:
                     contains_keywords = True
                     if keyword not in found_keywords:
                         found_keywords.append(keyword)
                     keyword_contexts[keyword] = f"Image alt: {img['alt']}"
         
-        # Check common card elements and other components
+        # Check common card elements and other components. Select all card
+        # selectors in one pass and dedupe overlapping matches (e.g. '.card'
+        # and '[class*="card"]' hit the same nodes) so each card's text is
+        # extracted and scanned exactly once for all keywords.
         card_selectors = [
-            '.card', '[class*="card"]', '.product', '.item', 
+            '.card', '[class*="card"]', '.product', '.item',
             '[class*="product"]', '[class*="item"]', 'article',
             '.listing', '[class*="listing"]'
         ]
-        
-        for selector in card_selectors:
-            for card in soup.select(selector):
-                card_text = card.get_text(separator=' ', strip=True).lower()
-                
-                # Check for keywords in card content
-                for keyword in keywords:
-                    keyword_lower = keyword.lower()
-                    if keyword_lower in card_text:
-                        contains_keywords = True
-                        if keyword not in found_keywords:
-                            found_keywords.append(keyword)
-                        
-                        # Try to get more specific context within the card
-                        card_title = card.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', '.title', '.heading'])
-                        if card_title:
-                            title_text = card_title.get_text(strip=True)
-                            keyword_contexts[keyword] = f"Card title: {title_text}"
-                        else:
-                            # Just use the card text if no specific element found
-                            context_part = card_text[:100] + "..." if len(card_text) > 100 else card_text
-                            keyword_contexts[keyword] = f"Card content: {context_part}"
+
+        seen_cards = set()
+        for card in soup.select(', '.join(card_selectors)):
+            if id(card) in seen_cards:
+                continue
+            seen_cards.add(id(card))
+            card_text = card.get_text(separator=' ', strip=True).lower()
+
+            # Scan the card text once for every keyword
+            for keyword, _ in scan_text_for_keywords(card_text, keywords, automaton):
+                contains_keywords = True
+                if keyword not in found_keywords:
+                    found_keywords.append(keyword)
+
+                # Try to get more specific context within the card
+                card_title = card.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', '.title', '.heading'])
+                if card_title:
+                    title_text = card_title.get_text(strip=True)
+                    keyword_contexts[keyword] = f"Card title: {title_text}"
+                else:
+                    # Just use the card text if no specific element found
+                    context_part = card_text[:100] + "..." if len(card_text) > 100 else card_text
+                    keyword_contexts[keyword] = f"Card content: {context_part}"
         
         # If include_meta is True, check meta tags as well (regardless of previous matches)
         if include_meta:
@@ -222,8 +668,7 @@ def check_page_for_keywords(url, keywords, include_meta=True):
                 meta_info['title'] = title_tag.get_text()
                 
                 # Check title for keywords
-                for keyword in keywords:
-                    keyword_lower = keyword.lower()
+                for keyword, keyword_lower in kw_pairs:
                     if keyword_lower in title_text:
                         contains_keywords = True
                         if keyword not in found_keywords:
@@ -237,9 +682,8 @@ def check_page_for_keywords(url, keywords, include_meta=True):
                 
                 if meta_name in ['description', 'keywords'] and meta_content:
                     meta_info[meta_name] = meta_tag.get('content')
-                    
-                    for keyword in keywords:
-                        keyword_lower = keyword.lower()
+
+                    for keyword, keyword_lower in kw_pairs:
                         if keyword_lower in meta_content:
                             contains_keywords = True
                             if keyword not in found_keywords:
@@ -254,9 +698,8 @@ def check_page_for_keywords(url, keywords, include_meta=True):
                 if 'og:' in meta_prop or 'twitter:' in meta_prop:
                     prop_type = 'Open Graph' if 'og:' in meta_prop else 'Twitter'
                     meta_info[meta_prop] = meta_tag.get('content')
-                    
-                    for keyword in keywords:
-                        keyword_lower = keyword.lower()
+
+                    for keyword, keyword_lower in kw_pairs:
                         if keyword_lower in meta_content:
                             contains_keywords = True
                             if keyword not in found_keywords:
@@ -269,6 +712,39 @@ def check_page_for_keywords(url, keywords, include_meta=True):
         print(f"Error checking keywords for {url}: {str(e)}")
         return False, [], {}, {}
 
+# How long finished/errored extraction bookkeeping is kept for status
+# queries before it is evicted. Without this the per-client dicts grow
+# forever on a long-running server.
+EXTRACTION_STATE_TTL = 3600  # seconds
+
+def _evict_stale_extractions():
+    """Drop bookkeeping for extractions that finished over an hour ago.
+
+    Called when a new extraction starts, so the dicts stay bounded without
+    needing a background task. Running extractions are never touched.
+    """
+    try:
+        cutoff = datetime.datetime.utcnow() - datetime.timedelta(seconds=EXTRACTION_STATE_TTL)
+        for cid in list(active_extractions.keys()):
+            entry = active_extractions.get(cid)
+            if entry is None or entry.get("status") == STATUS_RUNNING:
+                continue
+            if entry.get("last_updated", cutoff) <= cutoff:
+                active_extractions.pop(cid, None)
+                extraction_stats.pop(cid, None)
+                message_queues.pop(cid, None)
+                message_loops.pop(cid, None)
+                extraction_done_events.pop(cid, None)
+        # Orphaned stats (client never registered, or evicted earlier)
+        for cid in list(extraction_stats.keys()):
+            if cid not in active_extractions:
+                stats = extraction_stats.get(cid, {})
+                end_time = stats.get("end_time")
+                if isinstance(end_time, datetime.datetime) and end_time <= cutoff:
+                    extraction_stats.pop(cid, None)
+    except Exception:
+        logger.exception("Error evicting stale extraction state")
+
 async def add_project_with_scraping(
     user_email: str, 
     url: str, 
@@ -284,10 +760,24 @@ async def add_project_with_scraping(
     """
     Add a new project with threaded extraction, communicating progress via WebSockets.
     """
+    slot_acquired = False
+    submitted = False
     try:
         if not url:
             raise HTTPException(status_code=400, detail="URL is required")
-        
+
+        # Backpressure: refuse new work up-front rather than queueing unbounded
+        # extractions that would hold their state in RAM while waiting
+        if not extraction_slots.acquire(blocking=False):
+            raise HTTPException(
+                status_code=429,
+                detail="Too many extractions in progress. Please try again later."
+            )
+        slot_acquired = True
+
+        # Evict bookkeeping left over from long-finished extractions
+        _evict_stale_extractions()
+
         # Always set scrape_mode to "all" and pages_limit to 0 to indicate no limit
         scrape_mode = "all"
         pages_limit = 0
@@ -338,11 +828,13 @@ async def add_project_with_scraping(
         if not client_id:
             client_id = f"project_{str(project_id)}"
         
-        # Register in active extractions with initial status
+        # Register in active extractions with initial status. Interrupts are
+        # signalled through an Event - is_set() is a single C-level flag read,
+        # cheap enough to test on every page of the crawl
         active_extractions[client_id] = {
             "project_id": str(project_id),
             "status": STATUS_RUNNING,
-            "interrupt_requested": False,
+            "interrupt_event": threading.Event(),
             "last_updated": datetime.datetime.utcnow()
         }
         
@@ -359,9 +851,12 @@ async def add_project_with_scraping(
             "chunks_processed": 0
         }
         
-        # Create a thread-specific message queue
+        # Create a message queue on this event loop; the extraction thread
+        # feeds it through call_soon_threadsafe
         if ws_manager:
-            message_queues[client_id] = queue.Queue()
+            message_queues[client_id] = asyncio.Queue()
+            message_loops[client_id] = asyncio.get_running_loop()
+            extraction_done_events[client_id] = asyncio.Event()
             
             # Start message consumer in a separate task
             asyncio.create_task(consume_messages(client_id, ws_manager))
@@ -375,11 +870,11 @@ async def add_project_with_scraping(
             }, client_id)
             
             # Start extraction in a separate thread with scrape preferences, search keywords, and max depth
-            thread_pool.submit(
-                run_extraction_thread, 
-                url, 
-                str(project_id), 
-                client_id, 
+            future = thread_pool.submit(
+                run_extraction_thread,
+                url,
+                str(project_id),
+                client_id,
                 user_email,
                 scrape_mode,
                 pages_limit,
@@ -388,54 +883,68 @@ async def add_project_with_scraping(
                 include_meta,
                 max_depth  # Pass the max depth parameter
             )
-        
+            # Free the backpressure slot when the extraction finishes
+            future.add_done_callback(lambda _f: extraction_slots.release())
+            submitted = True
+
+        if slot_acquired and not submitted:
+            # No worker was started (no ws_manager) - give the slot back
+            extraction_slots.release()
+
         return {
             "message": "Project added successfully, extraction started in background", 
             "project_id": str(project_id),
             "client_id": client_id,
             "processing_status": processing_status
         }
+    except HTTPException:
+        if slot_acquired and not submitted:
+            extraction_slots.release()
+        raise
     except Exception as e:
-        print(f"Error in add_project_with_scraping: {str(e)}")
-        print(traceback.format_exc())
+        if slot_acquired and not submitted:
+            extraction_slots.release()
+        logger.exception("Error in add_project_with_scraping")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-def extract_links_from_html(html_content, base_url):
+def extract_links_from_html(html_content, base_url, domain_filter=None):
     """
-    Extract all links from the HTML content and normalize them
+    Extract all links from the HTML content and normalize them.
+
+    domain_filter restricts results to URLs containing that domain; it
+    defaults to the domain of base_url. Off-domain absolute hrefs are
+    rejected with a substring check before any normalization work is done.
     """
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, BS_PARSER)
         links = set()
-        
-        # Parse base URL for normalization
+
+        # Parse the base URL once and precompute the same-domain prefix so the
+        # per-link check is a single string compare instead of a full urlparse
         parsed_base = urlparse(base_url)
-        base_domain = parsed_base.netloc
-        
+        base_domain = domain_filter or parsed_base.netloc
+        base_prefix = f"{parsed_base.scheme or 'https'}://{base_domain}"
+
         for a_tag in soup.find_all('a', href=True):
             href = a_tag['href'].strip()
-            
+
             # Skip empty links and javascript links
             if not href or href.startswith('javascript:') or href == '#':
                 continue
-                
-            # Normalize URL
-            if href.startswith('/'):
-                # Relative URL
-                scheme = parsed_base.scheme or 'https'
-                href = f"{scheme}://{base_domain}{href}"
-            elif not (href.startswith('http://') or href.startswith('https://')):
-                # Relative URL without leading slash
-                if not base_url.endswith('/'):
-                    href = f"{base_url}/{href}"
-                else:
-                    href = f"{base_url}{href}"
-            
+
+            # Absolute off-domain hrefs are the common rejection case: a
+            # substring test on the raw href skips them before urljoin ever
+            # allocates a normalized URL string
+            if href.startswith(('http://', 'https://')) and base_domain not in href[:256]:
+                continue
+
+            # urljoin handles leading-slash, no-slash and absolute URLs uniformly
+            href = urljoin(base_url, href)
+
             # Only include links from the same domain
-            parsed_href = urlparse(href)
-            if parsed_href.netloc == base_domain or not parsed_href.netloc:
+            if href.startswith(base_prefix):
                 links.add(href)
-                
+
         return list(links)
     except Exception as e:
         print(f"Error extracting links: {e}")
@@ -445,8 +954,17 @@ def process_extracted_links(extracted_links, client_id, project_id, collection,
     """
     Process the extracted links by visiting them and extracting content recursively up to a specified depth.
     """
+    project_oid = _as_object_id(project_id)
     visited_links = processing_status.get("visited_links", {})
     visited_urls = set(visited_links.keys())  # Track URLs we've already visited to avoid repetition
+    # Also skip anything already recorded in the visited_links collection
+    # from a previous run of this project
+    try:
+        for doc in sync_visited_links_collection.find(
+                {"project_id": project_oid}, {"url": 1, "_id": 0}):
+            visited_urls.add(doc["url"])
+    except Exception:
+        logger.exception("Error loading visited links for project %s", project_id)
     links_to_visit = list(extracted_links.values())
     
     # Network performance statistics
@@ -465,40 +983,155 @@ def process_extracted_links(extracted_links, client_id, project_id, collection,
         "total_errors": 0
     })
 
-    def scrape_links(links, current_depth):
-        if current_depth > depth:
+    # Sampled progress logging: at crawl speed a log per URL dominates the
+    # WebSocket channel, so emit one aggregated progress message every
+    # LOG_SAMPLE_EVERY pages or LOG_SAMPLE_INTERVAL seconds, whichever first.
+    # Errors are still logged immediately.
+    LOG_SAMPLE_EVERY = 20
+    LOG_SAMPLE_INTERVAL = 0.25
+    log_state = {"count": 0, "last_flush": time.monotonic()}
+
+    # Deltas accumulated since the last DB flush; these are applied with
+    # atomic $inc/$min/$max operators so MongoDB updates the counters in
+    # place instead of rewriting the whole network_stats subdocument.
+    STATS_FLUSH_EVERY = 20
+    stats_delta = {"inc": {}, "fastest": None, "slowest": None, "pending": 0}
+
+    def record_stat(field, amount=1):
+        stats_delta["inc"][field] = stats_delta["inc"].get(field, 0) + amount
+
+    def flush_network_stats():
+        if not stats_delta["inc"] and stats_delta["fastest"] is None and stats_delta["slowest"] is None:
             return
+        update_project_network_stats_sync(
+            collection,
+            project_id,
+            stats_delta["inc"],
+            fastest_ms=stats_delta["fastest"],
+            slowest_ms=stats_delta["slowest"]
+        )
+        stats_delta["inc"] = {}
+        stats_delta["fastest"] = None
+        stats_delta["slowest"] = None
+        stats_delta["pending"] = 0
+
+    def log_progress(url, current_depth):
+        log_state["count"] += 1
+        now = time.monotonic()
+        if (log_state["count"] % LOG_SAMPLE_EVERY == 0
+                or now - log_state["last_flush"] > LOG_SAMPLE_INTERVAL):
+            log_state["last_flush"] = now
+            send_log(
+                client_id, "info",
+                f"Scraped {log_state['count']} links so far (current: {url} at depth {current_depth})"
+            )
+
+    # Scraped documents are stored in batches instead of one insert round
+    # trip per link; store_many_in_mongodb upserts the whole batch in a
+    # single unordered bulk_write
+    DOC_BATCH_SIZE = 50
+    pending_docs = []
+
+    def flush_pending_docs():
+        if pending_docs:
+            store_many_in_mongodb(pending_docs)
+            pending_docs.clear()
+
+    # Visit records are upserted into the visited_links collection in
+    # batches keyed by (project_id, url) instead of accumulating inside the
+    # project document
+    VISITED_BATCH_SIZE = 100
+    visited_ops = []
+
+    def flush_visited_ops():
+        if visited_ops:
+            try:
+                sync_visited_links_collection.bulk_write(visited_ops, ordered=False)
+            except Exception:
+                logger.exception("Error storing visited links for project %s", project_id)
+            visited_ops.clear()
+
+    def record_visited(url, record):
+        visited_links[url] = record
+        visited_ops.append(UpdateOne(
+            {"project_id": project_oid, "url": url},
+            {"$set": record},
+            upsert=True
+        ))
+        if len(visited_ops) >= VISITED_BATCH_SIZE:
+            flush_visited_ops()
 
-        for link in links:
-            url = link['url']
+    def _normalize_url(raw_url):
+        """Canonicalize a URL so the visited set dedupes trivial aliases.
+
+        Drops the #fragment and lowercases the scheme and host - the same
+        page otherwise gets scraped once per anchor link pointing at it.
+        """
+        try:
+            parts = urlsplit(raw_url)
+            return urlunsplit((parts.scheme.lower(), parts.netloc.lower(),
+                               parts.path, parts.query, ''))
+        except ValueError:
+            return raw_url
+
+    def scrape_links(links, current_depth):
+        # Iterative BFS over a deque of (depth, link) pairs. The old
+        # recursive version rebuilt a filtered new_links list per level and
+        # could hit the recursion limit on deep sites; here newly extracted
+        # links are just appended and the visited check happens on pop.
+        queue = deque((current_depth, link) for link in links)
+        while queue:
+            current_depth, link = queue.popleft()
+            if current_depth > depth:
+                continue
+
+            url = _normalize_url(link['url'])
             if url in visited_urls:
-                send_log(client_id, "info", f"Skipping already visited link: {url}")
                 continue
 
             try:
-                send_log(client_id, "info", f"Scraping link at depth {current_depth}: {url}")
+                log_progress(url, current_depth)
                 network_stats["total_requests"] += 1
+                record_stat("total_requests")
 
-                # Scrape the link
-                scraped_data = scrape_website(url, extract_product_info=True)
+                # Scrape the link over the shared keep-alive session
+                scraped_data = scrape_website(url, extract_product_info=True, session=_shared_session)
                 visited_urls.add(url)
 
                 # Update network stats
                 if 'network_metrics' in scraped_data:
                     metrics = scraped_data['network_metrics']
+                    duration_ms = metrics.get('duration_ms', 0)
+                    size_bytes = metrics.get('content_size_bytes', 0)
                     network_stats["successful_requests"] += 1
-                    network_stats["total_size_bytes"] += metrics.get('content_size_bytes', 0)
-                    network_stats["total_load_time_ms"] += metrics.get('duration_ms', 0)
-                    network_stats["fastest_load_ms"] = min(network_stats["fastest_load_ms"], metrics.get('duration_ms', float('inf')))
-                    network_stats["slowest_load_ms"] = max(network_stats["slowest_load_ms"], metrics.get('duration_ms', 0))
+                    network_stats["total_size_bytes"] += size_bytes
+                    network_stats["total_load_time_ms"] += duration_ms
+                    network_stats["fastest_load_ms"] = min(network_stats["fastest_load_ms"], duration_ms or float('inf'))
+                    network_stats["slowest_load_ms"] = max(network_stats["slowest_load_ms"], duration_ms)
                     status_code = str(metrics.get('status_code', 'unknown'))
                     network_stats["status_codes"][status_code] = network_stats["status_codes"].get(status_code, 0) + 1
 
-                # Store scraped data
-                store_in_mongodb(scraped_data)
+                    record_stat("successful_requests")
+                    record_stat("total_size_bytes", size_bytes)
+                    record_stat("total_load_time_ms", duration_ms)
+                    record_stat(f"status_codes.{status_code}")
+                    if duration_ms:
+                        if stats_delta["fastest"] is None or duration_ms < stats_delta["fastest"]:
+                            stats_delta["fastest"] = duration_ms
+                        if stats_delta["slowest"] is None or duration_ms > stats_delta["slowest"]:
+                            stats_delta["slowest"] = duration_ms
+
+                stats_delta["pending"] += 1
+                if stats_delta["pending"] >= STATS_FLUSH_EVERY:
+                    flush_network_stats()
+
+                # Store scraped data (batched)
+                pending_docs.append(scraped_data)
+                if len(pending_docs) >= DOC_BATCH_SIZE:
+                    flush_pending_docs()
 
                 # Add to visited links
-                visited_links[url] = {
+                record_visited(url, {
                     "url": url,
                     "scraped": True,
                     "scraped_at": datetime.datetime.utcnow().isoformat(),
@@ -509,72 +1142,76 @@ def process_extracted_links(extracted_links, client_id, project_id, collection,
                         "load_time_ms": scraped_data['network_metrics'].get('duration_ms', 0),
                     },
                     "product_info": scraped_data.get('product_info', {}),
-                }
+                })
 
-                # Recursively scrape new links
+                # Queue newly extracted links for the next depth level; the
+                # visited check when they are popped filters duplicates
                 if current_depth < depth and scraped_data.get('extracted_links'):
-                    new_links = [link for link in scraped_data['extracted_links'] if link['url'] not in visited_urls]
-                    scrape_links(new_links, current_depth + 1)
+                    for new_link in scraped_data['extracted_links']:
+                        queue.append((current_depth + 1, new_link))
 
             except Exception as e:
                 network_stats["failed_requests"] += 1
                 network_stats["total_errors"] += 1
+                record_stat("failed_requests")
+                record_stat("total_errors")
                 send_log(client_id, "error", f"Error scraping link {url}: {str(e)}")
-                visited_links[url] = {"url": url, "scraped": False, "error": str(e)}
+                record_visited(url, {"url": url, "scraped": False, "error": str(e)})
 
     # Start scraping links
     scrape_links(links_to_visit, current_depth=1)
 
-    # Update network stats
+    # Flush the remaining buffered documents, visit records and counter
+    # deltas, then compute the derived averages
+    flush_pending_docs()
+    flush_visited_ops()
+    flush_network_stats()
     if network_stats["successful_requests"] > 0:
         network_stats["avg_load_time_ms"] = network_stats["total_load_time_ms"] / network_stats["successful_requests"]
         network_stats["avg_size_kb"] = (network_stats["total_size_bytes"] / network_stats["successful_requests"]) / 1024
     if network_stats["fastest_load_ms"] == float('inf'):
         network_stats["fastest_load_ms"] = 0
 
-    # Update project with visited links and network stats
+    # Update the project with a visited-link count and the derived average
+    # fields; the per-link records themselves live in the visited_links
+    # collection and the raw counters were applied incrementally above
     update_project_partial_sync(
         collection,
         project_id,
         {
-            "processing_status.visited_links": visited_links,
-            "processing_status.network_stats": network_stats
+            "processing_status.visited_links_count": len(visited_links),
+            "processing_status.network_stats.avg_load_time_ms": network_stats["avg_load_time_ms"],
+            "processing_status.network_stats.avg_size_kb": network_stats["avg_size_kb"]
         }
     )
 
     return visited_links
 
+# Non-navigational URL prefixes. They are all literal strings, so a single
+# startswith-on-a-tuple C call beats regex dispatch - is_invalid_url runs for
+# every extracted link, and the common http(s) case rejects immediately
+_BAD_PREFIXES = ('javascript:', 'mailto:', 'tel:', '#', 'data:', 'about:', 'file:')
+
 def is_invalid_url(url):
     """Check if a URL is invalid or non-navigational"""
     if not url or not isinstance(url, str):
         return True
-        
-    invalid_patterns = [
-        r'^javascript:',   # JavaScript links
-        r'^mailto:',       # Email links
-        r'^tel:',          # Phone links
-        r'^#',             # Anchor links
-        r'^data:',         # Data URLs
-        r'^about:',        # About URLs
-        r'^file:'          # File URLs
-    ]
-    
-    for pattern in invalid_patterns:
-        if re.match(pattern, url):
-            return True
-            
+
+    if url.startswith(_BAD_PREFIXES):
+        return True
+
     # Check URL length
     if len(url) > 2000:
         return True
-        
+
     try:
         # Check if the URL has a valid scheme
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         if not parsed.scheme or not parsed.netloc:
             return True
-            
+
         return False
-    except:
+    except ValueError:
         return True
 
 def run_extraction_thread(
@@ -595,25 +1232,120 @@ def run_extraction_thread(
     connection is lost or the user navigates away from the page.
     """
     print(f"Starting extraction thread for {url} with client_id {client_id}")
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
-    # Create a thread-local MongoDB client
-    thread_client = AsyncIOMotorClient("mongodb://localhost:27017")
-    thread_db = thread_client.hackathon
-    thread_projects_collection = thread_db.projects
-    
-    # Track visited URLs to avoid duplicates
-    visited_urls = set()
-    # URLs that matched keywords (only if keywords were provided)
-    keyword_matched_urls = set()
-    # Queue for URLs to visit with their depth level
-    url_queue = Queue()
+
+    # All DB access from this thread is synchronous - use the shared pooled client
+    thread_projects_collection = sync_projects_collection
+
+    # Capture the interrupt event once so the per-page check is a single
+    # C-level flag read rather than dict lookups through should_interrupt
+    interrupt_event = active_extractions.get(client_id, {}).get("interrupt_event") or threading.Event()
+
+    # Seen-URL membership. Each URL gets an integer id on first sight, which
+    # travels with it through the frontier; all other per-URL state is keyed
+    # by that id. With pybloom_live installed, membership itself is a scalable
+    # Bloom filter holding a couple of bytes per URL instead of the full
+    # string - a false positive (1 in 10k) just skips one real page. Without
+    # it, an exact set is used.
+    if ScalableBloomFilter is not None:
+        seen_urls = ScalableBloomFilter(initial_capacity=100000, error_rate=0.0001)
+    else:
+        seen_urls = set()
+    url_visited = bytearray()  # id -> 0 while queued, 1 once visited
+    visited_count = 0
+
+    def new_uid(link):
+        """Register a first-seen URL and hand out the next integer id"""
+        seen_urls.add(link)
+        url_visited.append(0)
+        return len(url_visited) - 1
+
+    # Ids of URLs that matched keywords (only if keywords were provided)
+    matched_ids = set()
+    # Frontier of (url, depth) pairs to visit. Only the dispatcher thread
+    # touches it: a plain FIFO deque for an ordinary crawl, or - when keywords
+    # are given - a heap ordered by a cheap relevance score so the most
+    # promising URLs are fetched first (focused crawl) instead of strict BFS
+    use_focused_crawl = bool(search_keywords)
+    keyword_tokens = [kw.lower() for kw in (search_keywords or [])]
+    # Build the multi-keyword matcher once for the whole crawl - every page
+    # is checked against the same keywords
+    kw_automaton = build_keyword_automaton(search_keywords) if search_keywords else None
+    url_queue = deque()
+    url_heap = []  # (-score, depth, url) entries when focused crawling
+
+    def score_link(link, parent_matches=0):
+        """Cheap URL relevance score: keyword hits in the URL plus how many
+        keywords the page that linked to it matched. The automaton finds all
+        keyword hits in one pass over the URL; the per-token substring loop
+        is only the fallback when pyahocorasick is absent."""
+        link_lower = link.lower()
+        score = parent_matches
+        if kw_automaton is not None:
+            for _ in kw_automaton.iter(link_lower):
+                score += 2
+        else:
+            for token in keyword_tokens:
+                if token in link_lower:
+                    score += 2
+        return score
+
+    def frontier_push(link, depth, uid, parent_matches=0):
+        """Add a URL to the frontier, keeping the focused-crawl heap bounded"""
+        if use_focused_crawl:
+            heapq.heappush(url_heap, (-score_link(link, parent_matches), depth, link, uid))
+            if len(url_heap) > MAX_FRONTIER_SIZE:
+                # A sorted list is a valid heap, so trim the low-score tail
+                url_heap.sort()
+                del url_heap[MAX_FRONTIER_SIZE:]
+        else:
+            url_queue.append((link, depth, uid))
+
+    def frontier_pop():
+        """Take the next (url, depth, id): highest score first, FIFO otherwise"""
+        if use_focused_crawl:
+            _neg_score, depth, link, uid = heapq.heappop(url_heap)
+            return link, depth, uid
+        return url_queue.popleft()
+
+    def frontier_len():
+        return len(url_heap) if use_focused_crawl else len(url_queue)
+
     # Initial URL with depth 0
-    url_queue.put((url, 0))
+    url = sys.intern(url)
+    frontier_push(url, 0, new_uid(url))
     base_domain = urlparse(url).netloc
-    
-    # Initialize tracking variables
+
+    # The crawl is domain-bounded, so every request hits the same host: warm
+    # the DNS cache once and reuse a single keep-alive session so connection
+    # and TLS setup are not repeated per page
+    try:
+        socket.getaddrinfo(base_domain, 443)
+    except Exception:
+        pass
+    http_session = requests.Session()
+    # Size the connection pool to the fetcher concurrency so every worker
+    # holds a persistent connection instead of tearing down sockets under
+    # load (requests would otherwise cap the per-host pool below it)
+    _adapter = requests.adapters.HTTPAdapter(
+        pool_connections=2, pool_maxsize=FETCH_WORKERS
+    )
+    http_session.mount("http://", _adapter)
+    http_session.mount("https://", _adapter)
+
+    # Precompute the allowed URL prefixes once; a startswith check per dequeued
+    # link is far cheaper than running urlparse on every URL in the frontier
+    same_domain_prefixes = (f"http://{base_domain}/", f"https://{base_domain}/")
+    same_domain_exact = (f"http://{base_domain}", f"https://{base_domain}")
+
+    def is_same_domain(link):
+        """Cheap domain check: prefix compare first, full parse only for URLs
+        that don't match the common shapes (mixed case, explicit ports, ...)"""
+        if link.startswith(same_domain_prefixes) or link in same_domain_exact:
+            return True
+        return urlparse(link).netloc == base_domain
+
+    # Initialize tracking variables. The keyword result dicts are keyed by
+    # integer URL id, not the URL string itself
     pages_checked = 0
     scraped_pages = []
     keyword_matches = {}
@@ -621,6 +1353,121 @@ def run_extraction_thread(
     meta_info_extracted = {}
     pages_with_keywords = 0
     all_extracted_links = {}  # Dictionary to track extracted links
+    bytes_processed = 0  # running total of fetched content bytes
+    scraping_start = time.monotonic()  # reset once the crawl loop actually starts
+
+    # Sampled crawl-progress logging: one "Crawling page N" line per page
+    # floods the channel on big crawls, so the emission stride grows with the
+    # page count - every page early on, every 10th past 50, every 100th past
+    # 500. Database counters are unaffected; they flow through the batched
+    # progress writes for every page regardless.
+    progress_emit = {"next": 1}
+
+    def _progress_stride(n):
+        if n < 50:
+            return 1
+        if n < 500:
+            return 10
+        return 100
+
+    # Buffer per-page progress writes and apply them as a single bulk_write
+    # instead of paying a round trip to MongoDB after every page
+    PROGRESS_FLUSH_OPS = 25
+    PROGRESS_FLUSH_INTERVAL = 2.0  # seconds
+    pending_set_fields = {}
+    progress_state = {"last_flush": time.monotonic(), "queued": 0}
+    project_oid = ObjectId(project_id)
+
+    # Newly crawled URLs waiting to be appended to the site_data arrays with
+    # an incremental $push/$each, instead of resending the whole (potentially
+    # multi-MB) list at completion
+    pending_array_items = {
+        "site_data.scraped_pages": [],
+        "site_data.sitemap_pages": []
+    }
+
+    def flush_progress_ops():
+        """Write all buffered progress updates in one unordered bulk_write"""
+        # MongoDB allows $push and $set in the same update document, so the
+        # array appends and the last_updated stamp ride in a single op
+        # instead of one op per field plus one for the timestamp
+        push_ops = {}
+        for field, items in pending_array_items.items():
+            if items:
+                push_ops[field] = {"$each": items}
+                pending_array_items[field] = []
+        if not push_ops and not pending_set_fields:
+            return
+        try:
+            # Counter $sets coalesce in the buffer (last write wins), so a
+            # flush covering K pages still ships a single update document
+            pending_set_fields["processing_status.last_updated"] = datetime.datetime.utcnow().isoformat()
+            combined = {"$set": dict(pending_set_fields)}
+            if push_ops:
+                combined["$push"] = push_ops
+            # Hand the combined update to the shared bulk pipeline, where it
+            # rides along with flushes from any other running crawls
+            queue_project_update(project_oid, combined)
+        except Exception as bulk_err:
+            print(f"Error flushing progress updates: {str(bulk_err)}")
+        pending_set_fields.clear()
+        progress_state["last_flush"] = time.monotonic()
+        progress_state["queued"] = 0
+
+    def queue_progress_op(update):
+        """Buffer a progress update; flush when the batch or interval fills up"""
+        pending_set_fields.update(update.get("$set", {}))
+        progress_state["queued"] += 1
+        if (progress_state["queued"] >= PROGRESS_FLUSH_OPS
+                or time.monotonic() - progress_state["last_flush"] >= PROGRESS_FLUSH_INTERVAL):
+            flush_progress_ops()
+
+    # Batch the dispatcher's progress chatter into log_batch frames; urgent
+    # messages (errors, warnings) still go out immediately
+    log_batcher = LogBatcher(client_id)
+
+    # Decouple storage from crawling: a dedicated writer thread drains scraped
+    # documents off a queue and stores them in batches of 50, so the
+    # dispatcher never blocks on MongoDB while it could be feeding fetchers.
+    # The fetch path waits on the target site and the write path waits on
+    # Mongo - running them on separate threads lets the two overlap.
+    STORE_FLUSH_DOCS = 50
+    _WRITER_STOP = object()  # sentinel telling the writer to drain and exit
+    write_queue = queue.Queue()
+    writer_state = {"stopped": False}
+
+    def writer_loop():
+        batch = []
+        while True:
+            try:
+                item = write_queue.get(timeout=1.0)
+            except queue.Empty:
+                # Idle moment - persist whatever has accumulated
+                if batch:
+                    store_many_in_mongodb(batch)
+                    batch = []
+                continue
+            if item is _WRITER_STOP:
+                break
+            batch.append(item)
+            if len(batch) >= STORE_FLUSH_DOCS:
+                store_many_in_mongodb(batch)
+                batch = []
+        if batch:
+            store_many_in_mongodb(batch)
+
+    writer_thread = threading.Thread(
+        target=writer_loop, daemon=True, name=f"store-writer-{client_id}"
+    )
+    writer_thread.start()
+
+    def stop_writer():
+        """Signal the writer to drain its queue and wait for it to finish"""
+        if writer_state["stopped"]:
+            return
+        writer_state["stopped"] = True
+        write_queue.put(_WRITER_STOP)
+        writer_thread.join(timeout=10)
 
     # Update extraction stats to track progress
     extraction_stats[client_id] = {
@@ -657,12 +1504,15 @@ def run_extraction_thread(
             "stats_tracking_enabled": True  # Enable detailed statistics tracking
         }
         
-        # Ensure project has latest status
+        # Ensure project has latest status and empty page lists - the crawl
+        # appends to these incrementally as pages are visited
         update_project_partial_sync(
             thread_projects_collection,
-            project_id,
+            project_oid,
             {
                 "processing_status": processing_status,
+                "site_data.scraped_pages": [],
+                "site_data.sitemap_pages": []
             }
         )
         
@@ -672,11 +1522,16 @@ def run_extraction_thread(
         send_log(client_id, "info", "Process will continue in the background even if you close this browser window")
         
         # Step 1: Process robots.txt
+        # Durations are measured with the monotonic clock - wall-clock time
+        # can jump under NTP adjustments and produce negative intervals
         send_log(client_id, "info", f"Processing robots.txt for {url}")
-        robots_start = time.time()
+        robots_start = time.monotonic()
         robots = None
         try:
-            robots = Robots(site=url)
+            robots = _cached_site_asset(
+                base_domain, "robots",
+                lambda: Robots(site=url, session=http_session)
+            )
             if hasattr(robots, '_id') and robots._id:
                 processing_status["robots_status"] = "success"
                 send_log(client_id, "success", f"Successfully processed robots.txt")
@@ -690,18 +1545,25 @@ def run_extraction_thread(
             processing_status["errors"].append(error_msg)
             send_log(client_id, "error", error_msg)
         
+        extraction_stats[client_id]["robots_time"] = time.monotonic() - robots_start
+
         # Step 2: Process sitemap
-        sitemap_start = time.time()
-        sitemap_pages = [url]  # Default to just the main URL
+        sitemap_start = time.monotonic()
+        sitemap_page_iter = iter([url])  # Default to just the main URL
         send_log(client_id, "info", f"Processing sitemap for {url}")
         
         try:
-            sitemap = Sitemap(start_url=url)
+            sitemap = _cached_site_asset(
+                base_domain, "sitemap",
+                lambda: Sitemap(start_url=url, session=http_session)
+            )
             if hasattr(sitemap, 'page_urls') and sitemap.page_urls:
-                sitemap_pages = list(sitemap.page_urls)
+                # Stream the discovered URLs instead of copying the whole set
+                # into yet another list - large sitemaps run to six figures
+                sitemap_page_iter = sitemap.iter_page_urls()
                 processing_status["sitemap_status"] = "success"
-                processing_status["pages_found"] = len(sitemap_pages)
-                send_log(client_id, "success", f"Found {len(sitemap_pages)} pages in sitemap")
+                processing_status["pages_found"] = len(sitemap.page_urls)
+                send_log(client_id, "success", f"Found {len(sitemap.page_urls)} pages in sitemap")
             else:
                 processing_status["sitemap_status"] = "no_pages"
                 processing_status["errors"].append("No pages found in sitemap")
@@ -713,187 +1575,290 @@ def run_extraction_thread(
             send_log(client_id, "error", error_msg)
             send_log(client_id, "info", "Continuing with crawling from the base URL")
         
-        # Step 3: Queue sitemap pages for crawling
+        extraction_stats[client_id]["sitemap_time"] = time.monotonic() - sitemap_start
+
+        # Step 3: Queue sitemap pages for crawling, streaming straight from
+        # the sitemap's URL set into the frontier. Nested sitemaps and
+        # binary assets are dropped on the way past - endswith on a tuple
+        # is a single C call
         send_log(client_id, "info", "Queuing sitemap pages for crawling...")
         queue_count = 0
-        for page_url in sitemap_pages:
-            if page_url not in visited_urls:
-                url_queue.put((page_url, 0))  # All sitemap pages start at depth 0
+        skipped_non_html = 0
+        for page_url in sitemap_page_iter:
+            if page_url.lower().endswith(NON_HTML_EXTENSIONS):
+                skipped_non_html += 1
+                continue
+            # Intern so every structure that later holds this URL (frontier,
+            # page lists, stored arrays) shares a single string object
+            page_url = sys.intern(page_url)
+            if page_url not in seen_urls and is_same_domain(page_url):
+                frontier_push(page_url, 0, new_uid(page_url))  # All sitemap pages start at depth 0
                 queue_count += 1
         
+        if skipped_non_html:
+            send_log(client_id, "info", "Skipping %d non-HTML sitemap entries", skipped_non_html)
         send_log(client_id, "info", f"Queued {queue_count} URLs from sitemap for crawling")
         
         # Step 4: Process URLs recursively
-        send_log(client_id, "info", f"Starting recursive crawling from {url_queue.qsize()} initial URLs")
+        send_log(client_id, "info", f"Starting recursive crawling from {frontier_len()} initial URLs")
         
-        # Process URLs from queue with depth tracking
-        while not url_queue.empty():
-            # Update extraction stats periodically
-            extraction_stats[client_id]["pages_attempted"] = pages_checked
-            extraction_stats[client_id]["pages_successful"] = len(scraped_pages)
-            extraction_stats[client_id]["last_updated"] = datetime.datetime.utcnow().isoformat()
-            
-            # Check for interruption before processing each URL
-            if should_interrupt(client_id):
-                send_log(client_id, "warning", "Extraction process interrupted by user")
-                processing_status["extraction_status"] = STATUS_INTERRUPTED
-                processing_status["end_time"] = datetime.datetime.utcnow().isoformat()
-                processing_status["errors"].append("Extraction was interrupted by user request")
-                
-                # Update project with interrupted status
-                update_project_partial_sync(
-                    thread_projects_collection,
-                    project_id,
-                    {
-                        "processing_status.extraction_status": STATUS_INTERRUPTED,
-                        "processing_status.end_time": processing_status["end_time"],
-                        "processing_status.errors": processing_status["errors"]
-                    }
+        # Process URLs with a pool of fetcher worker threads. The crawl is
+        # network-I/O bound, so N blocking fetchers give close to N x the
+        # throughput of the old serial loop. Workers only fetch and parse;
+        # all bookkeeping (visited/queued sets, storage, progress writes)
+        # stays on this dispatcher thread so no locking is needed.
+        def _process_url(current_url, depth):
+            """Fetch and analyze a single URL on a fetcher worker thread.
+
+            Touches no shared state - the dispatcher merges the results.
+            """
+            send_log(client_id, "info", "Scraping page content: %s", current_url)
+            scraped_data = scrape_website(current_url, session=http_session)
+
+            contains_keywords = False
+            matches, meta_info, contexts = [], {}, {}
+            if search_keywords and len(search_keywords) > 0:
+                send_log(client_id, "detail", "Checking page for keywords: %s", current_url)
+                # Reuse the markup scrape_website just fetched; the keyword
+                # check only falls back to its own request when raw_html is
+                # missing (e.g. the fetch failed)
+                contains_keywords, matches, meta_info, contexts = check_page_for_keywords(
+                    current_url,
+                    search_keywords,
+                    include_meta,
+                    automaton=kw_automaton,
+                    html=scraped_data.get('raw_html')
                 )
-                
-                # Send final status message before breaking the loop
-                send_log(client_id, "info", f"Final status: Interrupted after processing {pages_checked} pages")
-                break
-            
-            current_url, depth = url_queue.get()
-            
-            # Skip if already visited
-            if current_url in visited_urls:
-                continue
-                
-            # Skip if from a different domain
-            url_domain = urlparse(current_url).netloc
-            if url_domain != base_domain:
-                continue
-            
-            # Mark as visited to avoid duplicates
-            visited_urls.add(current_url)
-            pages_checked += 1
-            
-            # Log the current crawling progress
-            send_log(client_id, "info", f"Crawling page {pages_checked} at depth {depth}: {current_url}")
-            
-            try:
-                # Check for keywords if specified
-                should_store = True
-                if search_keywords and len(search_keywords) > 0:
-                    send_log(client_id, "detail", f"Checking page for keywords: {current_url}")
-                    contains_keywords, matches, meta_info, contexts = check_page_for_keywords(
-                        current_url, 
-                        search_keywords, 
-                        include_meta
+
+            new_links = []
+            if depth < max_depth:
+                # scrape_website already collected and deduplicated hrefs
+                # during its parse - filter those instead of running a second
+                # BeautifulSoup pass over raw_html
+                for link in scraped_data.get('extracted_links', []):
+                    link_url = link.get('url')
+                    if link_url and is_same_domain(link_url):
+                        new_links.append(link_url)
+
+            return scraped_data, new_links, contains_keywords, matches, meta_info, contexts
+
+        fetch_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=FETCH_WORKERS, thread_name_prefix=f"fetch-{client_id[:12]}"
+        )
+        in_flight = {}  # future -> (url, depth)
+        scraping_start = time.monotonic()
+        try:
+            while frontier_len() or in_flight:
+                # Update extraction stats periodically. The counters are cheap
+                # plain stores; the isoformat string is only rebuilt every few
+                # pages since nothing reads it more often than that
+                extraction_stats[client_id]["pages_attempted"] = pages_checked
+                extraction_stats[client_id]["pages_successful"] = len(scraped_pages)
+                extraction_stats[client_id]["bytes_processed"] = bytes_processed
+                if pages_checked % 5 == 0:
+                    extraction_stats[client_id]["last_updated"] = datetime.datetime.utcnow().isoformat()
+
+                # Check for interruption before dispatching more URLs
+                if interrupt_event.is_set():
+                    send_log(client_id, "warning", "Extraction process interrupted by user")
+                    processing_status["extraction_status"] = STATUS_INTERRUPTED
+                    processing_status["end_time"] = datetime.datetime.utcnow().isoformat()
+                    processing_status["errors"].append("Extraction was interrupted by user request")
+
+                    # Flush buffered logs, documents and progress first so the
+                    # interrupted status is the last write the project sees
+                    log_batcher.flush()
+                    stop_writer()
+                    flush_progress_ops()
+                    flush_pending_ops(durable=True)
+
+                    # Update project with interrupted status
+                    update_project_partial_sync(
+                        thread_projects_collection,
+                        project_oid,
+                        {
+                            "processing_status.extraction_status": STATUS_INTERRUPTED,
+                            "processing_status.end_time": processing_status["end_time"],
+                            "processing_status.errors": processing_status["errors"]
+                        }
                     )
-                    
-                    if contains_keywords:
-                        keyword_matched_urls.add(current_url)
-                        keyword_matches[current_url] = matches
-                        keyword_contexts[current_url] = contexts
-                        meta_info_extracted[current_url] = meta_info
-                        pages_with_keywords += 1
-                        
-                        # Log matches
-                        send_log(client_id, "success", f"Page contains keywords: {', '.join(matches)}")
-                        for kw, context in contexts.items():
-                            send_log(client_id, "detail", f"Match '{kw}': {context[:100]}...")
-                    else:
-                        # Still crawl but don't store if no keywords match
-                        should_store = False
-                        send_log(client_id, "detail", f"No keywords found on this page")
-                
-                # Scrape the page to extract content and links
-                send_log(client_id, "info", f"Scraping page content: {current_url}")
-                scraped_data = scrape_website(current_url)
-                
-                # Extract links for recursive crawling if not at max depth
-                if depth < max_depth:
-                    # Extract links from the page content
-                    page_content = scraped_data.get('raw_html', '')
-                    
-                    if page_content:
-                        # Find and queue new links
-                        new_links = extract_links_from_html(page_content, current_url)
-                        new_link_count = 0
-                        
-                        for link in new_links:
-                            if link not in visited_urls:
-                                url_queue.put((link, depth + 1))
-                                new_link_count += 1
-                        
-                        send_log(client_id, "detail", f"Found {len(new_links)} links, queued {new_link_count} new ones for depth {depth+1}")
-                    else:
-                        send_log(client_id, "warning", f"No HTML content to extract links from")
-                else:
-                    send_log(client_id, "detail", f"Max depth {max_depth} reached, not extracting further links")
-                
-                # Store the scraped data if needed
-                if should_store:
-                    # Add to the list of scraped pages
-                    scraped_pages.append(current_url)
-                    
-                    # If we have meta information from the keyword search, add it to scraped data
-                    if current_url in meta_info_extracted and meta_info_extracted[current_url]:
-                        scraped_data["meta_info"] = meta_info_extracted[current_url]
-                    
-                    # Store scraped data in MongoDB
-                    store_in_mongodb(scraped_data)
-                    
-                    send_log(client_id, "success", f"Successfully stored page content for {current_url}")
-                    
-                    # Log content stats
-                    text_count = len(scraped_data.get('content', {}).get('text_content', []))
-                    image_count = len(scraped_data.get('content', {}).get('images', []))
-                    send_log(client_id, "detail", f"Extracted {text_count + image_count} elements ({text_count} text, {image_count} images)")
-            
-            except Exception as e:
-                error_msg = f"Error processing {current_url}: {str(e)}"
-                send_log(client_id, "error", error_msg)
-                print(f"Processing exception: {error_msg}")
-                print(traceback.format_exc())
-                processing_status["errors"].append(error_msg)
-            
-            # Update processing status after each page
-            processing_status["pages_found"] = len(visited_urls)
-            processing_status["pages_scraped"] = len(scraped_pages)
-            
-            # Update the project in MongoDB after each page to ensure progress is saved
-            update_project_partial_sync(
-                thread_projects_collection,
-                project_id,
-                {
-                    "processing_status.pages_found": len(visited_urls),
-                    "processing_status.pages_scraped": len(scraped_pages),
-                    "processing_status.last_updated": datetime.datetime.utcnow().isoformat()
-                }
-            )
-            
-            # Update extracted links in database periodically
-            if pages_checked % 5 == 0 and all_extracted_links:
-                update_project_partial_sync(
-                    thread_projects_collection,
-                    project_id,
-                    {
-                        "processing_status.extracted_links": all_extracted_links
-                    }
+
+                    # Send final status message before breaking the loop
+                    send_log(client_id, "info", f"Final status: Interrupted after processing {pages_checked} pages")
+                    break
+
+                # Keep the fetcher pool full
+                while len(in_flight) < FETCH_WORKERS and frontier_len():
+                    current_url, depth, uid = frontier_pop()
+
+                    # Skip if already visited
+                    if url_visited[uid]:
+                        continue
+
+                    # Skip if from a different domain
+                    if not is_same_domain(current_url):
+                        continue
+
+                    # Mark as visited to avoid duplicates
+                    url_visited[uid] = 1
+                    visited_count += 1
+                    pending_array_items["site_data.sitemap_pages"].append(current_url)
+                    pages_checked += 1
+
+                    # Log the current crawling progress (sampled - see
+                    # progress_emit above)
+                    if pages_checked >= progress_emit["next"]:
+                        progress_emit["next"] = pages_checked + _progress_stride(pages_checked)
+                        log_batcher.push("info", "Crawling page %d at depth %d: %s", pages_checked, depth, current_url)
+
+                    future = fetch_pool.submit(_process_url, current_url, depth)
+                    in_flight[future] = (current_url, depth, uid)
+
+                if not in_flight:
+                    break
+
+                # Merge finished fetches on the dispatcher thread
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
                 )
-            
-            # Check for interruption after each page
-            if should_interrupt(client_id):
-                send_log(client_id, "warning", f"Crawling interrupted after processing {pages_checked} pages")
-                handle_interruption(client_id, loop, project_id, processing_status)
-                return
+                for future in done:
+                    current_url, depth, uid = in_flight.pop(future)
+
+                    try:
+                        scraped_data, new_links, contains_keywords, matches, meta_info, contexts = future.result()
+
+                        # Account fetched bytes from the response metadata
+                        # instead of serializing the document just to size it
+                        bytes_processed += scraped_data.get('network_metrics', {}).get('content_size_bytes', 0)
+
+                        # Check for keywords if specified
+                        should_store = True
+                        if search_keywords and len(search_keywords) > 0:
+                            if contains_keywords:
+                                matched_ids.add(uid)
+                                keyword_matches[uid] = matches
+                                keyword_contexts[uid] = contexts
+                                meta_info_extracted[uid] = meta_info
+                                pages_with_keywords += 1
+
+                                # Log matches; skip building the per-keyword
+                                # context slices if detail logs are being dropped
+                                log_batcher.push("success", "Page contains keywords: %s", ', '.join(matches))
+                                if detail_logging_enabled(client_id):
+                                    for kw, context in contexts.items():
+                                        log_batcher.push("detail", "Match '%s': %s...", kw, context[:100])
+                            else:
+                                # Still crawl but don't store if no keywords match
+                                should_store = False
+                                log_batcher.push("detail", "No keywords found on this page")
+
+                        # Queue new links for recursive crawling if not at max depth
+                        if depth < max_depth:
+                            if new_links:
+                                new_link_count = 0
+
+                                for link in new_links:
+                                    # One canonical string object per URL -
+                                    # the same link text arrives as distinct
+                                    # str objects from different pages
+                                    link = sys.intern(link)
+                                    if link not in seen_urls:
+                                        frontier_push(link, depth + 1, new_uid(link), len(matches))
+                                        new_link_count += 1
+
+                                log_batcher.push("detail", "Found %d links, queued %d new ones for depth %d", len(new_links), new_link_count, depth + 1)
+                            else:
+                                log_batcher.push("warning", f"No HTML content to extract links from")
+                        else:
+                            log_batcher.push("detail", "Max depth %d reached, not extracting further links", max_depth)
+
+                        # Store the scraped data if needed
+                        if should_store:
+                            # Add to the list of scraped pages
+                            scraped_pages.append(current_url)
+                            pending_array_items["site_data.scraped_pages"].append(current_url)
+
+                            # If we have meta information from the keyword search, add it to scraped data
+                            if meta_info:
+                                scraped_data["meta_info"] = meta_info
+
+                            # raw_html is only needed in-process (link
+                            # extraction); nothing reads it back from the
+                            # database, so drop it before storage instead of
+                            # writing megabytes of markup per page
+                            scraped_data.pop("raw_html", None)
+
+                            # Hand the document to the writer thread; it is
+                            # stored in batches off the dispatcher's back
+                            write_queue.put(scraped_data)
+
+                            log_batcher.push("success", "Successfully stored page content for %s", current_url)
+
+                            # Log content stats - only computed if the detail
+                            # log will actually be delivered
+                            if detail_logging_enabled(client_id):
+                                text_count = len(scraped_data.get('content', {}).get('text_content', []))
+                                image_count = len(scraped_data.get('content', {}).get('images', []))
+                                log_batcher.push("detail", "Extracted %d elements (%d text, %d images)", text_count + image_count, text_count, image_count)
+
+                    except Exception as e:
+                        error_msg = f"Error processing {current_url}: {str(e)}"
+                        send_log(client_id, "error", error_msg)
+                        logger.exception("Processing exception for %s", current_url)
+                        processing_status["errors"].append(error_msg)
+
+                    # Update processing status after each page
+                    processing_status["pages_found"] = visited_count
+                    processing_status["pages_scraped"] = len(scraped_pages)
+
+                    # Queue a progress update after each page; these are batched and
+                    # written together so progress is still saved without a round
+                    # trip per page. last_updated is stamped once at flush time
+                    queue_progress_op({
+                        "$set": {
+                            "processing_status.pages_found": visited_count,
+                            "processing_status.pages_scraped": len(scraped_pages)
+                        }
+                    })
+
+                    # Update extracted links in database periodically
+                    if pages_checked % 5 == 0 and all_extracted_links:
+                        queue_progress_op({
+                            "$set": {
+                                "processing_status.extracted_links": all_extracted_links
+                            }
+                        })
+
+                # Check for interruption after merging a batch of results
+                if interrupt_event.is_set():
+                    send_log(client_id, "warning", f"Crawling interrupted after processing {pages_checked} pages")
+                    log_batcher.flush()
+                    stop_writer()
+                    flush_progress_ops()
+                    flush_pending_ops(durable=True)
+                    handle_interruption(client_id, project_id, processing_status, project_oid)
+                    return
+        finally:
+            # Drop any queued fetches and reclaim the worker threads
+            fetch_pool.shutdown(wait=False, cancel_futures=True)
         
-        # Final update to project with complete status
+        # Final update to project with complete status - wait for the writer
+        # to drain so every stored page is on disk before we say so
+        log_batcher.flush()
+        stop_writer()
+        flush_progress_ops()
+        flush_pending_ops(durable=True)
         processing_status["pages_scraped"] = len(scraped_pages)
-        processing_status["pages_found"] = len(visited_urls)
+        processing_status["pages_found"] = visited_count
         processing_status["extraction_status"] = STATUS_COMPLETED
         processing_status["end_time"] = datetime.datetime.utcnow().isoformat()
         
+        # The page lists have already been appended incrementally during the
+        # crawl, so the completion write only carries the status subdocument
         update_project_partial_sync(
             thread_projects_collection,
-            project_id,
+            project_oid,
             {
-                "site_data.scraped_pages": scraped_pages,
-                "site_data.sitemap_pages": list(visited_urls),
                 "processing_status": processing_status
             }
         )
@@ -904,26 +1869,24 @@ def run_extraction_thread(
             active_extractions[client_id]["last_updated"] = datetime.datetime.utcnow()
         
         send_log(client_id, "success", f"Extraction completed successfully. Results saved to database.")
-        send_log(client_id, "success", f"Final results: {len(scraped_pages)} pages scraped, {len(visited_urls)} pages found")
+        send_log(client_id, "success", f"Final results: {len(scraped_pages)} pages scraped, {visited_count} pages found")
         
         # Notify client of completion
-        if client_id in message_queues:
-            message_queues[client_id].put({
-                "type": "completion",
-                "timestamp": datetime.datetime.utcnow().isoformat(),
-                "message": json.dumps({
-                    "project_id": project_id,
-                    "processing_status": {
-                        "pages_found": processing_status["pages_found"],
-                        "pages_scraped": processing_status["pages_scraped"]
-                    }
-                })
+        _queue_message(client_id, {
+            "type": "completion",
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "message": json.dumps({
+                "project_id": project_id,
+                "processing_status": {
+                    "pages_found": processing_status["pages_found"],
+                    "pages_scraped": processing_status["pages_scraped"]
+                }
             })
+        })
     
     except Exception as e:
         error_msg = f"Unexpected error in extraction thread: {str(e)}"
-        print(error_msg)
-        print(traceback.format_exc())
+        logger.exception("Unexpected error in extraction thread")
         send_log(client_id, "error", error_msg)
         
         # Set error status
@@ -938,15 +1901,22 @@ def run_extraction_thread(
             processing_status["errors"].append(error_msg)
             update_project_partial_sync(
                 thread_projects_collection,
-                project_id, 
+                project_oid, 
                 {"processing_status": processing_status}
             )
         except Exception as e:
             print(f"Failed to update project with error status: {str(e)}")
     finally:
-        # Make sure to close resources
-        thread_client.close()
-        loop.close()
+        # Persist anything still sitting in the log, document and progress buffers
+        try:
+            log_batcher.flush()
+            stop_writer()
+            flush_progress_ops()
+            flush_pending_ops(durable=True)
+        except Exception as flush_err:
+            print(f"Error flushing progress on shutdown: {str(flush_err)}")
+        # Make sure to close resources (the shared sync client stays open)
+        http_session.close()
         print(f"Extraction thread for client {client_id} has completed")
         send_log(client_id, "info", "Background extraction process has ended")
         
@@ -955,37 +1925,43 @@ def run_extraction_thread(
             extraction_stats[client_id]["end_time"] = datetime.datetime.utcnow()
             extraction_stats[client_id]["pages_attempted"] = pages_checked
             extraction_stats[client_id]["pages_successful"] = len(scraped_pages)
+            extraction_stats[client_id]["bytes_processed"] = bytes_processed
+            extraction_stats[client_id]["scraping_time"] = time.monotonic() - scraping_start
+
+        # Wake the log consumer so it can drain the queue and exit
+        _signal_extraction_done(client_id)
 
 def should_interrupt(client_id):
-    """Check if an interruption has been requested for this client"""
+    """Check if an interruption has been requested for this client.
+
+    Hot loops should capture the interrupt_event once and call is_set()
+    directly instead of going through this lookup per page.
+    """
     if client_id not in active_extractions:
         return False
-    return active_extractions[client_id].get("interrupt_requested", False)
+    event = active_extractions[client_id].get("interrupt_event")
+    return event.is_set() if event is not None else False
 
-def handle_interruption(client_id, loop, project_id, processing_status):
-    """Handle the interruption process"""
+def handle_interruption(client_id, project_id, processing_status, project_oid=None):
+    """Handle the interruption process. Runs on the extraction worker thread,
+    so it writes through the shared synchronous client. Callers that already
+    hold the ObjectId pass it in so it is not reparsed from the hex string."""
     if client_id not in active_extractions:
         return
-    
+
     try:
         # Set status to interrupted
         active_extractions[client_id]["status"] = STATUS_INTERRUPTED
         active_extractions[client_id]["last_updated"] = datetime.datetime.utcnow()
-        
+
         # Update processing status
         processing_status["extraction_status"] = STATUS_INTERRUPTED
         processing_status["end_time"] = datetime.datetime.utcnow().isoformat()
-        
-        # Get MongoDB client
-        thread_client = AsyncIOMotorClient("mongodb://localhost:27017")
-        thread_db = thread_client.hackathon
-        thread_projects_collection = thread_db.projects
-        
-        # Ensure all extracted data is saved before terminating
-        # Get current extraction data
-        project_data = thread_projects_collection.find_one({"_id": ObjectId(project_id)})
-        
-        # Prepare final update with all collected data
+
+        # Prepare final update with all collected data - everything needed is
+        # already in processing_status, so there is no need to re-read the
+        # project document first
+
         final_update = {
             "processing_status": processing_status,
             "site_data.scraped_pages": processing_status.get("scraped_pages", []),
@@ -999,43 +1975,40 @@ def handle_interruption(client_id, loop, project_id, processing_status):
         
         # Update the project with interrupted status and all collected data
         update_project_partial_sync(
-            thread_projects_collection,
-            project_id,
+            sync_projects_collection,
+            project_oid if project_oid is not None else project_id,
             final_update
         )
-        
+
         # Send log message
         send_log(client_id, "warning", "Extraction interrupted by user request")
         send_log(client_id, "info", f"Data extraction completed for {processing_status.get('pages_scraped', 0)} pages before interruption")
         send_log(client_id, "info", "All extracted data has been saved and can be viewed in project details")
-        
-        # Clean up
-        thread_client.close()
-        
+
         # Send completion message
-        if client_id in message_queues:
-            message_queues[client_id].put({
-                "type": "completion",
-                "timestamp": datetime.datetime.utcnow().isoformat(),
-                "message": json.dumps({
-                    "project_id": project_id,
-                    "processing_status": {
-                        "pages_found": processing_status.get("pages_found", 0),
-                        "pages_scraped": processing_status.get("pages_scraped", 0),
-                        "extraction_status": STATUS_INTERRUPTED
-                    }
-                })
+        _queue_message(client_id, {
+            "type": "completion",
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "message": json.dumps({
+                "project_id": project_id,
+                "processing_status": {
+                    "pages_found": processing_status.get("pages_found", 0),
+                    "pages_scraped": processing_status.get("pages_scraped", 0),
+                    "extraction_status": STATUS_INTERRUPTED
+                }
             })
+        })
     except Exception as e:
-        print(f"Error handling interruption: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error handling interruption for %s", client_id)
 
 def interrupt_extraction(client_id):
     """Send an interrupt signal to an extraction process"""
     if client_id not in active_extractions:
         return False
     
-    active_extractions[client_id]["interrupt_requested"] = True
+    event = active_extractions[client_id].get("interrupt_event")
+    if event is not None:
+        event.set()
     active_extractions[client_id]["last_updated"] = datetime.datetime.utcnow()
     print(f"Interrupt requested for client {client_id}")
     return True
@@ -1078,55 +2051,71 @@ def get_extraction_status(client_id):
     
     return status
 
+@functools.lru_cache(maxsize=1024)
+def _oid(project_id_str):
+    """Parse-and-cache an ObjectId; repeat callers with the same hex string
+    skip the validation and allocation"""
+    return ObjectId(project_id_str)
+
+def _as_object_id(project_id):
+    """Accept a str or an already-constructed ObjectId - callers updating in
+    a loop should construct the ObjectId once and pass it in.
+
+    type() comparison instead of isinstance - ObjectId is never subclassed
+    here and the exact-type check is cheaper."""
+    return project_id if type(project_id) is ObjectId else _oid(project_id)
+
 def update_project_partial_sync(collection, project_id, update_data):
     """Update a project with partial data in a synchronous way"""
     try:
-        # Create a sync client to avoid asyncio issues in threads
-        client = MongoClient("mongodb://localhost:27017")
-        db = client.hackathon
-        
-        # Get the collection
-        coll = db[collection.name]
-        
-        # Build the update document
-        update_doc = {}
-        for key, value in update_data.items():
-            if "." in key:
-                # Handle nested fields with dot notation
-                update_doc[key] = value
-            else:
-                # Handle top-level fields
-                update_doc[key] = value
-        
-        # Update the document
-        coll.update_one({"_id": ObjectId(project_id)}, {"$set": update_doc})
-        
-        # Close the client
-        client.close()
-        
+        # Use the shared pooled sync client - opening a new MongoClient per
+        # update costs a TCP handshake and connection setup on every call
+        coll = sync_db[collection.name]
+
+        # pymongo takes the caller's dict as-is - dotted keys need no special
+        # handling, so there is nothing to rebuild key by key
+        coll.update_one({"_id": _as_object_id(project_id)}, {"$set": update_data})
+
+    except Exception as e:
+        logger.exception("Error updating project %s", project_id)
+
+def update_project_network_stats_sync(collection, project_id, inc_fields, fastest_ms=None, slowest_ms=None):
+    """
+    Apply network statistics deltas with atomic $inc/$min/$max operators so
+    MongoDB updates counters in place instead of rewriting the whole
+    network_stats subdocument on every flush.
+    """
+    try:
+        update = {}
+        if inc_fields:
+            update["$inc"] = {
+                f"processing_status.network_stats.{field}": value
+                for field, value in inc_fields.items()
+            }
+        if fastest_ms is not None:
+            update["$min"] = {"processing_status.network_stats.fastest_load_ms": fastest_ms}
+        if slowest_ms is not None:
+            update["$max"] = {"processing_status.network_stats.slowest_load_ms": slowest_ms}
+        if not update:
+            return
+
+        coll = sync_db[collection.name]
+        coll.update_one({"_id": _as_object_id(project_id)}, update)
+
     except Exception as e:
-        print(f"Error updating project: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error updating network stats for project %s", project_id)
 
 def update_project_array_sync(collection, project_id, array_field, items):
     """Update a project array field by adding items in a synchronous way"""
     try:
-        # Create a sync client to avoid asyncio issues in threads
-        client = MongoClient("mongodb://localhost:27017")
-        db = client.hackathon
-        
-        # Get the collection
-        coll = db[collection.name]
-        
+        # Use the shared pooled sync client instead of a throwaway connection
+        coll = sync_db[collection.name]
+
         # Update the document by pushing to the array
         coll.update_one(
-            {"_id": ObjectId(project_id)}, 
+            {"_id": _as_object_id(project_id)},
             {"$push": {array_field: {"$each": items}}}
         )
-        
-        # Close the client
-        client.close()
-        
+
     except Exception as e:
-        print(f"Error updating project array: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error updating project array for project %s", project_id)
@@ -3,14 +3,20 @@ from pymongo import MongoClient
 from datetime import datetime, UTC
 import traceback
 
+# One shared client for every Robots instance - each MongoClient carries its
+# own connection pool and monitor threads, far too heavy to build per fetch
+_mongo_client = MongoClient("mongodb://localhost:27017")
+
 class Robots:
-    def __init__(self, site, db="hackathon", col="robots"):
+    def __init__(self, site, db="hackathon", col="robots", session=None):
         site = site.strip()
-        client = MongoClient("mongodb://localhost:27017")
-        self.db = client[db]
+        self.db = _mongo_client[db]
         self.collection = self.db[col]
         self.sitemap_urls = []
         self._id = None
+        # Reuse the caller's keep-alive session when given - the crawl hits
+        # the same host right after this, so the TLS handshake is amortized
+        self._requester = session if session is not None else requests
         
         try:
             content, request_info = self.fetch_robots_txt(site)
@@ -35,7 +41,7 @@ class Robots:
                 url += "/"
 
             robots_url = url + "robots.txt"
-            response = requests.get(robots_url, timeout=10)
+            response = self._requester.get(robots_url, timeout=10)
 
             # collect metadata
             request_info = {
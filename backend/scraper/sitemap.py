@@ -6,13 +6,23 @@ from datetime import datetime, timezone, UTC
 import os
 import traceback
 
+# Shared client for the default deployment URI; a MongoClient owns a whole
+# connection pool plus monitor threads, so building one per Sitemap instance
+# is pure overhead. Non-default URIs still get their own client.
+_DEFAULT_MONGO_URI = "mongodb://localhost:27017"
+_default_client = MongoClient(_DEFAULT_MONGO_URI)
+
 class Sitemap:
     def __init__(self, start_url,
                  mongo_uri="mongodb://localhost:27017",
-                 db_name="hackathon"):
+                 db_name="hackathon",
+                 session=None):
         self.start_url = start_url
         self.page_urls = set([start_url])  # Initialize with at least the start URL
         self.parsed_sitemaps = set()
+        # Reuse the caller's keep-alive session when given so nested sitemap
+        # fetches against the same host skip repeated TCP/TLS handshakes
+        self._requester = session if session is not None else requests
         
         try:
             if not self.start_url.startswith("http"):
@@ -29,7 +39,7 @@ class Sitemap:
                 
             # Try to get the sitemap
             try:
-                req = requests.get(sitemap_url, timeout=10)
+                req = self._requester.get(sitemap_url, timeout=10)
                 if req.status_code == 200:
                     self.start_url = sitemap_url
                 else:
@@ -40,7 +50,7 @@ class Sitemap:
                 # Continue with just the start URL
             
             # MongoDB setup
-            client = MongoClient(mongo_uri)
+            client = _default_client if mongo_uri == _DEFAULT_MONGO_URI else MongoClient(mongo_uri)
             db = client[db_name]
             self.sitemaps_col = db["sitemaps"]
             self.pages_col = db["pages"]
@@ -56,7 +66,7 @@ class Sitemap:
 
     def _fetch(self, url):
         """Fetch a URL and return (response, content_type)."""
-        resp = requests.get(url, timeout=10)
+        resp = self._requester.get(url, timeout=10)
         return resp, resp.headers.get("Content-Type", "")
 
     def _detect_url_tag(self, soup):
@@ -142,11 +152,19 @@ class Sitemap:
             print(f"Error crawling sitemap {sitemap_url}: {e}")
             self.page_urls.add(sitemap_url)  # Add the URL as a fallback
 
+    def iter_page_urls(self):
+        """Yield discovered page URLs one at a time.
+
+        Lets callers stream the URLs into their own queue or filter without
+        copying the whole set into another list first.
+        """
+        yield from self.page_urls
+
     def fetch_and_store_pages(self):
         """Fetch every page URL, record network info, store in `pages`."""
         for url in sorted(self.page_urls):
             try:
-                resp = requests.get(url, timeout=10)
+                resp = self._requester.get(url, timeout=10)
                 info = {
                     "url": url,
                     "status_code": resp.status_code,
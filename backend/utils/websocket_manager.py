@@ -1,23 +1,33 @@
 from fastapi import WebSocket
 from typing import Dict, List, Any
 import json
+import orjson
 import asyncio
 import traceback
 
+# orjson options: serialize naive datetimes as UTC with a Z suffix so the
+# frontend can parse them like the stdlib isoformat strings it already expects
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
+        # Bound send_text methods cached at connect time so the hot send path
+        # skips the dict lookup + attribute resolution on every message
+        self._senders: Dict[str, Any] = {}
 
     async def connect(self, websocket: WebSocket, client_id: str):
         """Connect a client WebSocket with a client ID"""
         await websocket.accept()
         self.active_connections[client_id] = websocket
+        self._senders[client_id] = websocket.send_text
         print(f"WebSocket client connected: {client_id}")
 
     def disconnect(self, client_id: str):
         """Disconnect a client"""
         if client_id in self.active_connections:
             del self.active_connections[client_id]
+            self._senders.pop(client_id, None)
             print(f"WebSocket client disconnected: {client_id}")
 
     async def send_personal_message(self, message: str, client_id: str):
@@ -32,10 +42,13 @@ class ConnectionManager:
 
     async def send_personal_json(self, message: dict, client_id: str):
         """Send a JSON message to a specific client"""
-        if client_id in self.active_connections:
+        send = self._senders.get(client_id)
+        if send is not None:
             try:
-                await self.active_connections[client_id].send_json(message)
-                print(f"Sent message to client {client_id}: {message.get('type', 'unknown')} - {message.get('message', '')[:50]}...")
+                # orjson is much faster than the stdlib json encoder and handles
+                # datetime/ObjectId values without a custom encoder class
+                data = orjson.dumps(message, default=str, option=ORJSON_OPTIONS)
+                await send(data.decode())
             except Exception as e:
                 print(f"Error sending JSON message to client {client_id}: {e}")
                 print(traceback.format_exc())
@@ -240,6 +240,15 @@ export default function ExtractionLogs({ clientId, onComplete }: ExtractionLogsP
               } catch (err) {
                 console.error('Error parsing completion data:', err);
               }
+            } else if (data.type === 'log_batch') {
+              // Batched log messages - unwrap and append in one state update
+              const entries = (data.messages || []).map((entry: any) => ({
+                type: entry.type || 'info',
+                message: entry.message,
+                timestamp: entry.timestamp,
+                details: entry.details
+              }));
+              setLogs(prev => [...prev, ...entries]);
             } else {
               // Regular log message - add to logs
               setLogs(prev => [...prev, {